@@ -29,22 +29,26 @@ logger.addHandler(file_handler)
 logger.addHandler(console_handler)
 
 
-def log_message(level, message):
+def log_message(level, message, *args):
     """
     Logs a message with the given log level if logging is enabled.
 
+    Any extra arguments are merged into the message using %-formatting by the
+    logging module, only if the record is actually emitted.
+
     Args:
         level (str): The level of the log (e.g., 'debug', 'info', 'warning', 'error', 'critical').
         message (str): The message to log.
+        *args: Optional arguments for the message format string.
     """
     if LOG_SWITCH:
         if level == 'debug':
-            logger.debug(message)
+            logger.debug(message, *args)
         elif level == 'info':
-            logger.info(message)
+            logger.info(message, *args)
         elif level == 'warning':
-            logger.warning(message)
+            logger.warning(message, *args)
         elif level == 'error':
-            logger.error(message)
+            logger.error(message, *args)
         elif level == 'critical':
-            logger.critical(message)
+            logger.critical(message, *args)
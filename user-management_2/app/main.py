@@ -29,7 +29,7 @@ def main():
             "blood_group": "A+",
             "role": "user"
         }
-        updated_records = add_user(
+        new_user_info = add_user(
             new_user_data['username'],
             new_user_data['email'],
             new_user_data['age'],
@@ -50,7 +50,7 @@ def main():
         user_to_update = "dummy"
         updates = {"email": "new_dummy@example.com"}
         updated_user_info = update_user(user_to_update, updates, admin_username, is_admin=True)
-        log_message('info', f"Admin {admin_username} updated user {user_to_update}: {updates}")
+        log_message('info', "Admin %s updated user %s: %s", admin_username, user_to_update, updates)
     except (ValueError, PermissionError) as e:
         log_message('critical', str(e))
 
@@ -59,7 +59,7 @@ def main():
         admin_username = "kiran"
         user_to_view = "ndines"
         user_info = get_user_info(user_to_view, admin_username, is_admin=True)
-        log_message('info', f"Admin {admin_username} viewed user {user_to_view}: {user_info}")
+        log_message('info', "Admin %s viewed user %s: %s", admin_username, user_to_view, user_info)
     except (ValueError, PermissionError) as e:
         log_message('critical', str(e))
 
@@ -67,7 +67,7 @@ def main():
     try:
         admin_username = "nkiran"
         all_users = list_all_users(admin_username, is_admin=True)
-        log_message('info', f"Admin {admin_username} listed all users: {all_users}")
+        log_message('info', "Admin %s listed all users: %s", admin_username, all_users)
     except (ValueError, PermissionError) as e:
         log_message('critical', str(e))
 
@@ -75,10 +75,11 @@ def main():
     try:
         normal_username = "radha2"
         user_info = get_user_info(normal_username, normal_username, is_admin=False)
-        log_message('info', f"Normal user {normal_username} viewed their information: {user_info}")
+        log_message('info', "Normal user %s viewed their information: %s", normal_username, user_info)
     except (ValueError, PermissionError) as e:
         log_message('critical', str(e))
 
 
 # Run the main function
-main()
+if __name__ == "__main__":
+    main()
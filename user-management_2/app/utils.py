@@ -5,9 +5,49 @@ Contains utility functions for validating user data, adding users, and retrievin
 """
 
 import re
+import threading
+import types
+from collections import OrderedDict
+from functools import lru_cache
+from data import data
 from log import log_message
 from constants import VALID_COUNTRY_LIST, EXCLUDED_NUMBERS, VALID_GENDERS, VALID_BLOOD_GROUPS
 
+# Precompiled validation patterns
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$')
+
+# Reference values as normalized sets for constant-time lookups
+_EXCLUDED_NUMBERS = frozenset(EXCLUDED_NUMBERS)
+_VALID_GENDERS = frozenset(g.lower() for g in VALID_GENDERS)
+_VALID_BLOOD_GROUPS = frozenset(bg.upper() for bg in VALID_BLOOD_GROUPS)
+
+# Read-only view of all user records, handed out by list_all_users
+_RECORDS_VIEW = types.MappingProxyType(data['records'])
+
+
+@lru_cache(maxsize=4096)
+def _is_valid_email(email):
+    """Returns whether the email matches the expected format."""
+    return _EMAIL_RE.match(email) is not None
+
+
+@lru_cache(maxsize=4096)
+def _is_valid_mobile(mobile):
+    """Returns whether the mobile number consists of exactly 10 digits."""
+    return len(mobile) == 10 and mobile.isdecimal()
+
+
+@lru_cache(maxsize=4096)
+def _is_valid_gender(gender):
+    """Returns whether the gender is one of the valid genders."""
+    return gender.lower() in _VALID_GENDERS
+
+
+@lru_cache(maxsize=4096)
+def _is_valid_blood_group(blood_group):
+    """Returns whether the blood group is one of the valid blood groups."""
+    return blood_group.upper() in _VALID_BLOOD_GROUPS
+
 
 def validate_email(email):
     """
@@ -22,8 +62,7 @@ def validate_email(email):
     Returns:
         bool: True if the email is valid, False otherwise.
     """
-    email_regex = r'^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$'
-    if not re.match(email_regex, email):
+    if not _is_valid_email(email):
         log_message('error', f"Invalid email format: {email}")
         raise ValueError("Invalid email format")
     log_message('info', f"Valid email: {email}")
@@ -63,11 +102,10 @@ def validate_mobile(mobile):
     Returns:
         bool: True if the mobile number is valid, False otherwise.
     """
-    mobile_regex = r'^\d{10}$'
-    if not re.match(mobile_regex, mobile):
+    if not _is_valid_mobile(mobile):
         log_message('error', f"Invalid mobile number: {mobile}")
         raise ValueError("Invalid mobile number")
-    if mobile in EXCLUDED_NUMBERS:
+    if mobile in _EXCLUDED_NUMBERS:
         log_message('info', f"Excluded mobile number: {mobile}")
         return False
     log_message('info', f"Valid mobile number: {mobile}")
@@ -87,7 +125,7 @@ def validate_gender(gender):
     Returns:
         bool: True if the gender is valid, False otherwise.
     """
-    if gender.lower() not in VALID_GENDERS:
+    if not _is_valid_gender(gender):
         log_message('error', f"Invalid gender: {gender}")
         raise ValueError("Invalid gender")
     log_message('info', f"Valid gender: {gender}")
@@ -107,13 +145,103 @@ def validate_blood_group(blood_group):
     Returns:
         bool: True if the blood group is valid, False otherwise.
     """
-    if blood_group.upper() not in VALID_BLOOD_GROUPS:
+    if not _is_valid_blood_group(blood_group):
         log_message('error', f"Invalid blood group: {blood_group}")
         raise ValueError("Invalid blood group")
     log_message('info', f"Valid blood group: {blood_group}")
     return True
 
 
+def _validate_new_user(email, age, mobile, gender, blood_group):
+    """
+    Validates all details of a new user in a single pass.
+
+    Args:
+        email (str): The email address to validate.
+        age (int): The age to validate.
+        mobile (str): The mobile number to validate.
+        gender (str): The gender to validate.
+        blood_group (str): The blood group to validate.
+
+    Raises:
+        ValueError: If any of the details is invalid, naming the first invalid field.
+    """
+    if not _is_valid_email(email):
+        log_message('error', f"Invalid email format: {email}")
+        raise ValueError("Invalid email format")
+    if not (0 <= age <= 120):
+        log_message('error', f"Invalid age: {age}")
+        raise ValueError("Invalid age")
+    if not _is_valid_mobile(mobile):
+        log_message('error', f"Invalid mobile number: {mobile}")
+        raise ValueError("Invalid mobile number")
+    if mobile in _EXCLUDED_NUMBERS:
+        log_message('info', f"Excluded mobile number: {mobile}")
+    if not _is_valid_gender(gender):
+        log_message('error', f"Invalid gender: {gender}")
+        raise ValueError("Invalid gender")
+    if not _is_valid_blood_group(blood_group):
+        log_message('error', f"Invalid blood group: {blood_group}")
+        raise ValueError("Invalid blood group")
+    log_message('info', "Valid user details: email=%s, age=%s, mobile=%s, gender=%s, blood_group=%s",
+                email, age, mobile, gender, blood_group)
+
+
+# Validators for user fields, keyed by field name
+_VALIDATORS = {
+    "email": validate_email,
+    "age": validate_age,
+    "mobile": validate_mobile,
+    "gender": validate_gender,
+    "blood_group": validate_blood_group,
+}
+
+# Authorization decisions for get_user_info, keyed by (current_user, username, is_admin)
+_AUTH_CACHE_SIZE = 1024
+_AUTH_CACHE = OrderedDict()
+_AUTH_LOCK = threading.Lock()
+
+
+def _is_authorized(username, current_user, is_admin):
+    """
+    Returns whether the current user may view the given user's information.
+
+    Positive decisions are remembered until the user's record changes.
+
+    Args:
+        username (str): The username of the user whose information is requested.
+        current_user (str): The username of the current user making the request.
+        is_admin (bool): Whether the current user is an admin.
+
+    Returns:
+        bool: True if the current user is authorized, False otherwise.
+    """
+    key = (current_user, username, is_admin)
+    with _AUTH_LOCK:
+        if key in _AUTH_CACHE:
+            _AUTH_CACHE.move_to_end(key)
+            return True
+    if not (username == current_user or is_admin):
+        return False
+    with _AUTH_LOCK:
+        _AUTH_CACHE[key] = True
+        if len(_AUTH_CACHE) > _AUTH_CACHE_SIZE:
+            _AUTH_CACHE.popitem(last=False)
+    return True
+
+
+def _invalidate_auth_cache(username):
+    """
+    Drops cached authorization decisions for the given user.
+
+    Args:
+        username (str): The username whose record was added or changed.
+    """
+    with _AUTH_LOCK:
+        for key in [key for key in _AUTH_CACHE if key[1] == username]:
+            del _AUTH_CACHE[key]
+
+
 def get_user_info(username, current_user, is_admin):
     """
     Retrieves information for the specified user.
@@ -130,11 +258,10 @@ def get_user_info(username, current_user, is_admin):
     Returns:
         dict: The user information if the user is found and the current user is authorized.
     """
-    from data import data
     user_info = data['records'].get(username)
     if user_info:
-        if username == current_user or is_admin:
-            log_message('info', f"User info for {username}: {user_info}")
+        if _is_authorized(username, current_user, is_admin):
+            log_message('info', "User info for %s: %s", username, user_info)
             return user_info
         else:
             log_message('warning', f"Unauthorized access attempt by {current_user} to view {username}'s information")
@@ -156,12 +283,11 @@ def list_all_users(current_user, is_admin):
         PermissionError: If the current user is not authorized to list all users.
 
     Returns:
-        dict: A dictionary containing all users' information.
+        mappingproxy: A read-only view of all users' information.
     """
-    from data import data
     if is_admin:
         log_message('info', f"Admin {current_user} listing all users")
-        return data['records']
+        return _RECORDS_VIEW
     else:
         log_message('warning', f"Unauthorized access attempt by {current_user} to list all users")
         raise PermissionError("Unauthorized access")
@@ -187,19 +313,15 @@ def add_user(username, email, age, mobile, gender, blood_group, role, current_us
         ValueError: If any of the user details are invalid.
 
     Returns:
-        dict: The updated records with the new user added.
+        dict: The information of the newly added user.
     """
-    from data import data
+    records = data['records']
     if is_admin:
-        validate_email(email)
-        validate_age(age)
-        validate_mobile(mobile)
-        validate_gender(gender)
-        validate_blood_group(blood_group)
-        if username in data['records']:
+        _validate_new_user(email, age, mobile, gender, blood_group)
+        if username in records:
             log_message('error', f"User {username} already exists")
             raise ValueError("User already exists")
-        data['records'][username] = {
+        records[username] = {
             "email": email,
             "age": age,
             "mobile": mobile,
@@ -207,8 +329,9 @@ def add_user(username, email, age, mobile, gender, blood_group, role, current_us
             "blood_group": blood_group,
             "role": role
         }
-        log_message('info', f"Admin {current_user} added new user {username}")
-        return data['records']
+        _invalidate_auth_cache(username)
+        log_message('info', "Admin %s added new user %s", current_user, username)
+        return records[username]
     else:
         log_message('warning', f"Unauthorized access attempt by {current_user} to add new user {username}")
         raise PermissionError("Unauthorized access")
@@ -231,7 +354,6 @@ def update_user(username, updates, current_user, is_admin):
     Returns:
         dict: The updated user information.
     """
-    from data import data
     user_info = data['records'].get(username)
     if not user_info:
         log_message('error', f"User {username} not found")
@@ -241,17 +363,12 @@ def update_user(username, updates, current_user, is_admin):
         log_message('warning', f"Unauthorized access attempt by {current_user} to update user {username}")
         raise PermissionError("Unauthorized access")
 
-    if 'email' in updates:
-        validate_email(updates['email'])
-    if 'age' in updates:
-        validate_age(updates['age'])
-    if 'mobile' in updates:
-        validate_mobile(updates['mobile'])
-    if 'gender' in updates:
-        validate_gender(updates['gender'])
-    if 'blood_group' in updates:
-        validate_blood_group(updates['blood_group'])
-
-    data['records'][username].update(updates)
-    log_message('info', f"User {current_user} updated user {username}: {updates}")
-    return data['records'][username]
+    for field, value in updates.items():
+        validator = _VALIDATORS.get(field)
+        if validator:
+            validator(value)
+
+    user_info.update(updates)
+    _invalidate_auth_cache(username)
+    log_message('info', "User %s updated user %s: %s", current_user, username, updates)
+    return user_info